@@ -18,13 +18,56 @@ simple curves is not possible.
 To all beginners: GO AWAY!
 
 """
-from .const import (
-    AcisException,
-    ParsingError,
-    InvalidLinkStructure,
-    ExportError,
-)
-from .mesh import mesh_from_body, body_from_mesh
-from .entities import load, export_sat, export_sab, Body
-from .dbg import AcisDebugger, dump_sab_as_text
-from .dxf import export_dxf, load_dxf
\ No newline at end of file
+import importlib
+
+__all__ = [
+    "AcisDebugger",
+    "AcisException",
+    "Body",
+    "ExportError",
+    "InvalidLinkStructure",
+    "ParsingError",
+    "body_from_mesh",
+    "dump_sab_as_text",
+    "export_dxf",
+    "export_sab",
+    "export_sat",
+    "load",
+    "load_dxf",
+    "mesh_from_body",
+]
+
+# Import the implementation modules lazily (PEP 562), so that importing the
+# public interface does not load the SAT/SAB parsers and builders until they
+# are really used.
+_SOURCE_MODULES = {
+    "AcisException": "const",
+    "ParsingError": "const",
+    "InvalidLinkStructure": "const",
+    "ExportError": "const",
+    "mesh_from_body": "mesh",
+    "body_from_mesh": "mesh",
+    "load": "entities",
+    "export_sat": "entities",
+    "export_sab": "entities",
+    "Body": "entities",
+    "AcisDebugger": "dbg",
+    "dump_sab_as_text": "dbg",
+    "export_dxf": "dxf",
+    "load_dxf": "dxf",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _SOURCE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module("." + module_name, __package__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals().keys()) + __all__))
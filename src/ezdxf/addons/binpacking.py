@@ -33,6 +33,8 @@ import copy
 import math
 import random
 
+import numpy as np
+
 
 from ezdxf.enums import TextEntityAlignment
 from ezdxf.math import (
@@ -270,6 +272,10 @@ class Bin:
             raise ValueError("invalid depth")
         self.max_weight = float(max_weight)
         self.items: list[Item] = []
+        # extents of the placed items as structure-of-arrays for the
+        # vectorized fit test, one row per item in self.items:
+        # [min_x, min_y, min_z, max_x, max_y, max_z]
+        self._extents: np.ndarray = np.zeros((16, 6))
 
     def __len__(self):
         return len(self.items)
@@ -281,6 +287,7 @@ class Bin:
         """Returns a copy."""
         box = copy.copy(self)  # shallow copy
         box.items = list(self.items)
+        box._extents = self._extents.copy()
         return box
 
     def reset(self):
@@ -310,17 +317,66 @@ class Bin:
             if self.width < x + w or self.height < y + h or self.depth < z + d:
                 continue
             # new item fits inside the box at he current location and rotation:
-            item_bbox = item.bbox
             if (
-                not any(item_bbox.has_intersection(i.bbox) for i in self.items)
+                self._has_free_space(x, y, z, x + w, y + h, z + d)
                 and self.get_total_weight() + item.weight <= self.max_weight
             ):
+                self._append_extents(x, y, z, x + w, y + h, z + d)
                 self.items.append(item)
                 return True
 
         item.position = valid_item_position
         return False
 
+    def _has_free_space(
+        self, x0: float, y0: float, z0: float, x1: float, y1: float, z1: float
+    ) -> bool:
+        """Returns ``True`` if the space (x0, y0, z0) to (x1, y1, z1) does not
+        intersect any placed item.
+
+        This is the hot loop of the packer, the AABB test runs on the extents
+        array instead of the Item instances and has the same strict semantics
+        as BoundingBox.has_intersection(): touching items do not intersect.
+        """
+        count = len(self.items)
+        if count < 8:
+            # the vectorized test does not pay off for a few items
+            for placed in self.items:
+                px, py, pz = placed.position
+                pw, ph, pd = placed.get_dimension()
+                if (
+                    x0 < px + pw
+                    and px < x1
+                    and y0 < py + ph
+                    and py < y1
+                    and z0 < pz + pd
+                    and pz < z1
+                ):
+                    return False
+            return True
+        e = self._extents[:count]
+        return not bool(
+            (
+                (x0 < e[:, 3])
+                & (e[:, 0] < x1)
+                & (y0 < e[:, 4])
+                & (e[:, 1] < y1)
+                & (z0 < e[:, 5])
+                & (e[:, 2] < z1)
+            ).any()
+        )
+
+    def _append_extents(
+        self, x0: float, y0: float, z0: float, x1: float, y1: float, z1: float
+    ) -> None:
+        count = len(self.items)  # row index of the new item
+        extents = self._extents
+        if count >= len(extents):
+            extents = np.zeros((len(extents) * 2, 6))
+            extents[:count] = self._extents
+            self._extents = extents
+        extents[count] = (x0, y0, z0, x1, y1, z1)
+
     def get_capacity(self) -> float:
         """Returns the maximum fill volume of the bin."""
         return self.width * self.height * self.depth
@@ -512,21 +568,51 @@ class AbstractPacker:
         return Axis
 
 
-def shuffle_pack(packer: AbstractPacker, attempts: int) -> AbstractPacker:
+def _shuffle_pack_attempt(args: tuple[AbstractPacker, int]) -> AbstractPacker:
+    # worker function for shuffle_pack(), pickled into the worker processes
+    packer, seed = args
+    random.seed(seed)
+    packer.pack(PickStrategy.SHUFFLE)
+    return packer
+
+
+def shuffle_pack(
+    packer: AbstractPacker, attempts: int, max_workers: int | None = None
+) -> AbstractPacker:
     """Random shuffle packing. Returns a new packer with the best packing result,
     the input packer is unchanged.
+
+    The attempts are independent of each other, set `max_workers` to run them
+    in parallel processes.  The parallel mode spawns worker processes and
+    pickles the packer per attempt, this only pays off for packing tasks of
+    many items.
     """
     if attempts < 1:
         raise ValueError("expected attempts >= 1")
     best_ratio = 0.0
     best_packer = packer
-    for _ in range(attempts):
-        new_packer = packer.copy()
-        new_packer.pack(PickStrategy.SHUFFLE)
-        new_ratio = new_packer.get_fill_ratio()
-        if new_ratio > best_ratio:
-            best_ratio = new_ratio
-            best_packer = new_packer
+    if max_workers is None:
+        for _ in range(attempts):
+            new_packer = packer.copy()
+            new_packer.pack(PickStrategy.SHUFFLE)
+            new_ratio = new_packer.get_fill_ratio()
+            if new_ratio > best_ratio:
+                best_ratio = new_ratio
+                best_packer = new_packer
+        return best_packer
+
+    import concurrent.futures
+
+    # each attempt gets its own seed, the shuffle happens in the worker process
+    tasks = [
+        (packer.copy(), random.getrandbits(32)) for _ in range(attempts)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for new_packer in executor.map(_shuffle_pack_attempt, tasks):
+            new_ratio = new_packer.get_fill_ratio()
+            if new_ratio > best_ratio:
+                best_ratio = new_ratio
+                best_packer = new_packer
     return best_packer
 
 
@@ -1,6 +1,7 @@
 # Copyright (c) 2020-2023, Matthew Broadway
 # License: MIT License
 from __future__ import annotations
+import functools
 import math
 from typing import (
     Iterable,
@@ -1074,6 +1075,7 @@ def _draw_entities(
             frontend.skip_entity(entity, "invisible")
 
 
+@functools.lru_cache(maxsize=4096)
 def prepare_string_for_rendering(text: str, dxftype: str) -> str:
     assert "\n" not in text, "not a single line of text"
     if dxftype in {"TEXT", "ATTRIB", "ATTDEF"}:
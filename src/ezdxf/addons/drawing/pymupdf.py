@@ -1,11 +1,14 @@
 #  Copyright (c) 2023, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import Iterable, no_type_check
+from typing import Callable, Iterable, no_type_check
 import copy
+import functools
+import itertools
 
 from ezdxf.math import AnyVec, Vec2
 from ezdxf.colors import RGB
+from ezdxf.lldxf.const import VALID_DXF_LINEWEIGHTS
 from ezdxf.path import Path, Path2d, Command
 from ezdxf.version import __version__
 
@@ -30,6 +33,25 @@ __all__ = ["PyMuPdfBackend"]
 MM_TO_POINTS = 72.0 / 25.4  # 25.4 mm = 1 inch / 72
 
 
+def _as_vec2(v: AnyVec) -> Vec2:
+    # skip the re-wrap, the recorder already delivers Vec2 instances
+    return v if type(v) is Vec2 else Vec2(v)
+
+
+_BYTE_TO_FLOAT = tuple(value / 255.0 for value in range(256))
+
+
+def _hex_to_rgb_floats(color: Color) -> tuple[float, float, float]:
+    # bytes.fromhex parses all three channels in C code, without a transient
+    # RGB instance
+    try:
+        r, g, b = bytes.fromhex(color[1:7])
+    except ValueError:
+        return RGB.from_hex(color).to_floats()
+    table = _BYTE_TO_FLOAT
+    return table[r], table[g], table[b]
+
+
 class PyMuPdfBackend(recorder.Recorder):
     def __init__(self) -> None:
         super().__init__()
@@ -116,10 +138,16 @@ class PyMuPdfBackend(recorder.Recorder):
         return PyMuPdfRenderBackend(page, settings)
 
 
+def page_size_in_pt(page: layout.Page) -> tuple[int, int]:
+    """Returns the page size in PDF points (1/72 inch) as integers."""
+    return (
+        int(page.width_in_mm * MM_TO_POINTS),
+        int(page.height_in_mm * MM_TO_POINTS),
+    )
+
+
 def get_coordinate_output_space(page: layout.Page) -> int:
-    page_width_in_pt = int(page.width_in_mm * MM_TO_POINTS)
-    page_height_in_pt = int(page.height_in_mm * MM_TO_POINTS)
-    return max(page_width_in_pt, page_height_in_pt)
+    return max(page_size_in_pt(page))
 
 
 class PyMuPdfRenderBackend(BackendInterface):
@@ -152,10 +180,8 @@ class PyMuPdfRenderBackend(BackendInterface):
             }
         )
         self.settings = settings
-        self._stroke_width_cache: dict[float, float] = dict()
-        self._color_cache: dict[str, tuple[float, float, float]] = dict()
-        self.page_width_in_pt = int(page.width_in_mm * MM_TO_POINTS)
-        self.page_height_in_pt = int(page.height_in_mm * MM_TO_POINTS)
+        self._color_cache: dict[str, tuple[tuple[float, float, float], float]] = dict()
+        self.page_width_in_pt, self.page_height_in_pt = page_size_in_pt(page)
         # LineweightPolicy.ABSOLUTE:
         self.min_lineweight = 0.05  # in mm, set by configure()
         self.lineweight_scaling = 1.0  # set by configure()
@@ -181,7 +207,16 @@ class PyMuPdfRenderBackend(BackendInterface):
             self.abs_min_stroke_width,
             int(self.max_stroke_width * settings.fixed_stroke_width),
         )
+        # specialized for the current lineweight policy, rebuilt by configure():
+        self.resolve_stroke_width = self._make_stroke_width_resolver()
         self.page = self.doc.new_page(-1, self.page_width_in_pt, self.page_height_in_pt)
+        # All draw methods add their content to a single shared shape, which is
+        # committed once in finalize().  Creating and committing one shape per
+        # entity dominated the runtime for large drawings.
+        self._shape = self.page.new_shape()
+        # stroke style of the unfinished sub-paths in the shared shape:
+        # (color, stroke-width, opacity, close)
+        self._pending_stroke_style: tuple | None = None
 
     def get_pdf_bytes(self) -> bytes:
         return self.doc.tobytes()
@@ -193,102 +228,186 @@ class PyMuPdfRenderBackend(BackendInterface):
         return self.page.get_svg_image()
 
     def set_background(self, color: Color) -> None:
-        rgb = self.resolve_color(color)
-        opacity = alpha_to_opacity(color[7:9])
+        rgb, opacity = self.resolve_color(color)
         if color == (1.0, 1.0, 1.0) or opacity == 0.0:
             return
-        shape = self.new_shape()
+        shape = self.stroke_shape_for_filling()
         shape.drawRect([0, 0, self.page_width_in_pt, self.page_height_in_pt])
         shape.finish(width=None, color=None, fill=rgb, fill_opacity=opacity)
-        shape.commit()
 
-    def new_shape(self):
-        return self.page.new_shape()
+    def stroke_shape(self, properties: BackendProperties, close: bool):
+        """Returns the shared shape for stroking.
 
-    def finish_line(self, shape, properties: BackendProperties, close: bool) -> None:
-        color = self.resolve_color(properties.color)
-        width = self.resolve_stroke_width(properties.lineweight)
-        shape.finish(
+        Shape.finish() is postponed until the stroke style changes, consecutive
+        draw commands of the same style are finished in one call.
+        """
+        rgb, opacity = self.resolve_color(properties.color)
+        style = (
+            rgb,
+            self.resolve_stroke_width(properties.lineweight),
+            opacity,
+            close,
+        )
+        if self._pending_stroke_style != style:
+            self.finish_pending_strokes()
+            self._pending_stroke_style = style
+        return self._shape
+
+    def stroke_shape_for_filling(self):
+        """Returns the shared shape for filling, pending strokes are finished.
+
+        The caller has to finish the filled sub-paths immediately, merging
+        separate fill operations would alter the result of the even-odd rule.
+        """
+        self.finish_pending_strokes()
+        return self._shape
+
+    def finish_pending_strokes(self) -> None:
+        style = self._pending_stroke_style
+        if style is None:
+            return
+        self._pending_stroke_style = None
+        color, width, opacity, close = style
+        self._shape.finish(
             width=width,
             color=color,
             fill=None,
             lineJoin=1,
             lineCap=1,
-            stroke_opacity=alpha_to_opacity(properties.color[7:9]),
+            stroke_opacity=opacity,
             closePath=close,
         )
 
     def finish_filling(self, shape, properties: BackendProperties) -> None:
+        rgb, opacity = self.resolve_color(properties.color)
         shape.finish(
             width=None,
             color=None,
-            fill=self.resolve_color(properties.color),
-            fill_opacity=alpha_to_opacity(properties.color[7:9]),
+            fill=rgb,
+            fill_opacity=opacity,
             lineJoin=1,
             lineCap=1,
             closePath=True,
             even_odd=True,
         )
 
-    def resolve_color(self, color: Color) -> tuple[float, float, float]:
-        key = color[:7]
-        try:
-            return self._color_cache[key]
-        except KeyError:
-            pass
-        color_floats = RGB.from_hex(color).to_floats()
-        self._color_cache[key] = color_floats
-        return color_floats
-
-    def resolve_stroke_width(self, width: float) -> float:
-        try:
-            return self._stroke_width_cache[width]
-        except KeyError:
-            pass
-        stroke_width = self.min_stroke_width
-        if self.lineweight_policy == LineweightPolicy.ABSOLUTE:
-            stroke_width = (  # in points (pt) = 1/72 inch
-                max(self.min_lineweight, width) * MM_TO_POINTS * self.lineweight_scaling
-            )
-        elif self.lineweight_policy == LineweightPolicy.RELATIVE:
-            stroke_width = map_lineweight_to_stroke_width(
-                width, self.min_stroke_width, self.max_stroke_width
+    def resolve_color(self, color: Color) -> tuple[tuple[float, float, float], float]:
+        """Returns the RGB float tuple and the opacity for a hex color string."""
+        rgb_opacity = self._color_cache.get(color)
+        if rgb_opacity is None:
+            rgb_opacity = (
+                _hex_to_rgb_floats(color),
+                alpha_to_opacity(color[7:9]),
             )
-        stroke_width = max(self.abs_min_stroke_width, stroke_width)
-        self._stroke_width_cache[width] = stroke_width
-        return stroke_width
+            self._color_cache[color] = rgb_opacity
+        return rgb_opacity
+
+    def _make_stroke_width_resolver(self) -> Callable[[float], float]:
+        """Returns a stroke-width resolver specialized for the current lineweight
+        policy.
+
+        The policy does not change between configure() calls, so the per-call
+        branching and attribute lookups are folded into the closure.
+        """
+        abs_min_stroke_width = self.abs_min_stroke_width
+        policy = self.lineweight_policy
+        cache: dict[float, float] = dict()
+
+        if policy == LineweightPolicy.ABSOLUTE:
+            min_lineweight = self.min_lineweight
+            # stroke-width in points (pt) = 1/72 inch
+            scale = MM_TO_POINTS * self.lineweight_scaling
+
+            def resolve(width: float) -> float:
+                stroke_width = cache.get(width)
+                if stroke_width is None:
+                    stroke_width = max(
+                        abs_min_stroke_width, max(min_lineweight, width) * scale
+                    )
+                    cache[width] = stroke_width
+                return stroke_width
+
+            # warm the cache with the standard DXF lineweights, the hot path
+            # becomes a single dict hit without any math:
+            for lineweight in VALID_DXF_LINEWEIGHTS:
+                resolve(lineweight / 100.0)
+
+        elif policy == LineweightPolicy.RELATIVE:
+            min_stroke_width = self.min_stroke_width
+            max_stroke_width = self.max_stroke_width
+
+            def resolve(width: float) -> float:
+                stroke_width = cache.get(width)
+                if stroke_width is None:
+                    stroke_width = max(
+                        abs_min_stroke_width,
+                        map_lineweight_to_stroke_width(
+                            width, min_stroke_width, max_stroke_width
+                        ),
+                    )
+                    cache[width] = stroke_width
+                return stroke_width
+
+            # warm the cache with the standard DXF lineweights, mapping to the
+            # relative stroke width needs max/min/round per miss:
+            for lineweight in VALID_DXF_LINEWEIGHTS:
+                resolve(lineweight / 100.0)
+
+        else:  # LineweightPolicy.RELATIVE_FIXED
+            fixed_stroke_width = max(abs_min_stroke_width, self.min_stroke_width)
+
+            def resolve(width: float) -> float:
+                return fixed_stroke_width
+
+        return resolve
 
     def draw_point(self, pos: AnyVec, properties: BackendProperties) -> None:
-        shape = self.new_shape()
-        pos = Vec2(pos)
+        shape = self.stroke_shape(properties, close=False)
+        pos = _as_vec2(pos)
         shape.drawLine(pos, pos)
-        self.finish_line(shape, properties, close=False)
-        shape.commit()
 
     def draw_line(
         self, start: AnyVec, end: AnyVec, properties: BackendProperties
     ) -> None:
-        shape = self.new_shape()
-        shape.drawLine(Vec2(start), Vec2(end))
-        self.finish_line(shape, properties, close=False)
-        shape.commit()
+        shape = self.stroke_shape(properties, close=False)
+        shape.drawLine(_as_vec2(start), _as_vec2(end))
 
     def draw_solid_lines(
         self, lines: Iterable[tuple[AnyVec, AnyVec]], properties: BackendProperties
     ) -> None:
-        shape = self.new_shape()
+        # The input is often a tessellated polyline (end of segment i is the
+        # start of segment i+1), connected runs are emitted as one drawPolyline
+        # call instead of one drawLine call per segment.
+        shape = self.stroke_shape(properties, close=False)
+        draw_line = shape.drawLine
+        draw_polyline = shape.drawPolyline
+        run: list = []
         for start, end in lines:
-            shape.drawLine(start, end)
-        self.finish_line(shape, properties, close=False)
-        shape.commit()
+            if run:
+                if run[-1].isclose(start):
+                    run.append(end)
+                    continue
+                if len(run) == 2:
+                    draw_line(run[0], run[1])
+                else:
+                    draw_polyline(run)
+            run = [start, end]
+        if len(run) == 2:
+            draw_line(run[0], run[1])
+        elif run:
+            draw_polyline(run)
 
     def draw_path(self, path: Path | Path2d, properties: BackendProperties) -> None:
-        if len(path) == 0:
+        commands = path.command_codes()
+        if not commands:
+            return
+        shape = self.stroke_shape(properties, close=False)
+        if len(commands) == 1 and commands[0] == Command.LINE_TO:
+            # short-circuit for the common single-segment path, e.g. the ticks
+            # and extension lines of dimensions
+            shape.drawLine(_as_vec2(path.start), _as_vec2(path.end))
             return
-        shape = self.new_shape()
         add_path_to_shape(shape, path, close=False)
-        self.finish_line(shape, properties, close=False)
-        shape.commit()
 
     def draw_filled_paths(
         self,
@@ -296,25 +415,25 @@ class PyMuPdfRenderBackend(BackendInterface):
         holes: Iterable[Path | Path2d],
         properties: BackendProperties,
     ) -> None:
-        shape = self.new_shape()
-        for p in paths:
-            add_path_to_shape(shape, p, close=True)
-        for p in holes:
+        shape = self.stroke_shape_for_filling()
+        for p in itertools.chain(paths, holes):
             add_path_to_shape(shape, p, close=True)
         self.finish_filling(shape, properties)
-        shape.commit()
 
     def draw_filled_polygon(
         self, points: Iterable[AnyVec], properties: BackendProperties
     ) -> None:
-        vertices = Vec2.list(points)
+        if isinstance(points, list) and points and type(points[0]) is Vec2:
+            # common case: the recorder replay delivers a list of Vec2
+            vertices = points
+        else:
+            vertices = Vec2.list(points)
         if len(vertices) < 3:
             return
         # input coordinates are page coordinates in pdf units
-        shape = self.new_shape()
+        shape = self.stroke_shape_for_filling()
         shape.drawPolyline(vertices)
         self.finish_filling(shape, properties)
-        shape.commit()
 
     def configure(self, config: Configuration) -> None:
         self.lineweight_policy = config.lineweight_policy
@@ -323,12 +442,14 @@ class PyMuPdfRenderBackend(BackendInterface):
             min_lineweight_mm = config.min_lineweight * 25.4 / 300
             self.min_lineweight = max(0.05, min_lineweight_mm)
         self.lineweight_scaling = config.lineweight_scaling
+        self.resolve_stroke_width = self._make_stroke_width_resolver()
 
     def clear(self) -> None:
         pass
 
     def finalize(self) -> None:
-        pass
+        self.finish_pending_strokes()
+        self._shape.commit()
 
     def enter_entity(self, entity, properties) -> None:
         pass
@@ -337,27 +458,280 @@ class PyMuPdfRenderBackend(BackendInterface):
         pass
 
 
+class PyMuPdfRawRenderBackend(PyMuPdfRenderBackend):
+    """Render backend that writes the PDF path operators directly and inserts
+    the accumulated content stream once in finalize().
+
+    This bypasses the PyMuPDF Shape class, which builds the same operator
+    string through many small Python method calls (Point conversions, matrix
+    multiplications per vertex).  The output is visually identical to
+    PyMuPdfRenderBackend but faster for drawings with many entities.
+
+    Use it by overriding :meth:`PyMuPdfBackend.make_backend`.
+
+    """
+
+    def __init__(self, page: layout.Page, settings: layout.Settings) -> None:
+        super().__init__(page, settings)
+        # finished content stream fragments (q ... Q groups):
+        self._content: list[str] = []
+        # path operators of the pending (unfinished) stroke group:
+        self._path_ops: list[str] = []
+        # stroke style of the pending group: (color, stroke-width, opacity)
+        self._pending_raw_style: tuple | None = None
+        # current point of the pending group, to continue connected sub-paths:
+        self._current_point: Vec2 | None = None
+
+    # All emitted coordinates are flipped from the top-left page origin of the
+    # layout to the bottom-left origin of PDF user space:
+    # y-pdf = page-height - y-layout
+
+    def set_background(self, color: Color) -> None:
+        rgb, opacity = self.resolve_color(color)
+        if color == (1.0, 1.0, 1.0) or opacity == 0.0:
+            return
+        ops = ["q\n"]
+        if opacity < 1.0:
+            ops.append(f"/{self.page._set_opacity(CA=1, ca=opacity)} gs\n")
+        ops.append(f"{rgb[0]:g} {rgb[1]:g} {rgb[2]:g} rg\n")
+        ops.append(f"0 0 {self.page_width_in_pt} {self.page_height_in_pt} re\nf\nQ\n")
+        self._content.append("".join(ops))
+
+    def start_stroke(self, properties: BackendProperties) -> None:
+        """Starts a stroke group, strokes of the same style are collected in
+        one q/.../S/Q group, like the shared shape of the base class."""
+        rgb, opacity = self.resolve_color(properties.color)
+        style = (rgb, self.resolve_stroke_width(properties.lineweight), opacity)
+        if self._pending_raw_style != style:
+            self.flush_raw_strokes()
+            self._pending_raw_style = style
+
+    def flush_raw_strokes(self) -> None:
+        style = self._pending_raw_style
+        path_ops = self._path_ops
+        self._pending_raw_style = None
+        self._current_point = None
+        if style is None or not path_ops:
+            path_ops.clear()
+            return
+        rgb, width, opacity = style
+        ops = ["q\n1 J\n1 j\n"]
+        if opacity < 1.0:
+            ops.append(f"/{self.page._set_opacity(CA=opacity, ca=1)} gs\n")
+        ops.append(f"{width:g} w\n{rgb[0]:g} {rgb[1]:g} {rgb[2]:g} RG\n")
+        ops.extend(path_ops)
+        ops.append("S\nQ\n")
+        self._content.append("".join(ops))
+        path_ops.clear()
+
+    def add_stroke_line(self, start: Vec2, end: Vec2) -> None:
+        height = self.page_height_in_pt
+        current = self._current_point
+        if current is None or not current.isclose(start):
+            self._path_ops.append(f"{start.x:g} {height - start.y:g} m\n")
+        self._path_ops.append(f"{end.x:g} {height - end.y:g} l\n")
+        self._current_point = end
+
+    def fill_raw_path(self, properties: BackendProperties) -> None:
+        """Fills the collected path operators by the even-odd rule.
+
+        Like in the base class fills are not merged, that would alter the
+        result of the even-odd rule.
+        """
+        rgb, opacity = self.resolve_color(properties.color)
+        ops = ["q\n"]
+        if opacity < 1.0:
+            ops.append(f"/{self.page._set_opacity(CA=1, ca=opacity)} gs\n")
+        ops.append(f"{rgb[0]:g} {rgb[1]:g} {rgb[2]:g} rg\n")
+        ops.extend(self._path_ops)
+        ops.append("f*\nQ\n")
+        self._content.append("".join(ops))
+        self._path_ops.clear()
+        self._current_point = None
+
+    def draw_point(self, pos: AnyVec, properties: BackendProperties) -> None:
+        self.start_stroke(properties)
+        pos = _as_vec2(pos)
+        self.add_stroke_line(pos, pos)
+
+    def draw_line(
+        self, start: AnyVec, end: AnyVec, properties: BackendProperties
+    ) -> None:
+        self.start_stroke(properties)
+        self.add_stroke_line(_as_vec2(start), _as_vec2(end))
+
+    def draw_solid_lines(
+        self, lines: Iterable[tuple[AnyVec, AnyVec]], properties: BackendProperties
+    ) -> None:
+        self.start_stroke(properties)
+        add_stroke_line = self.add_stroke_line
+        for start, end in lines:
+            add_stroke_line(_as_vec2(start), _as_vec2(end))
+
+    def draw_path(self, path: Path | Path2d, properties: BackendProperties) -> None:
+        commands = path.command_codes()
+        if not commands:
+            return
+        self.start_stroke(properties)
+        if len(commands) == 1 and commands[0] == Command.LINE_TO:
+            # same short-circuit as in the base class
+            self.add_stroke_line(_as_vec2(path.start), _as_vec2(path.end))
+            return
+        self.add_raw_path(path, close=False)
+
+    def draw_filled_paths(
+        self,
+        paths: Iterable[Path | Path2d],
+        holes: Iterable[Path | Path2d],
+        properties: BackendProperties,
+    ) -> None:
+        self.flush_raw_strokes()
+        for p in itertools.chain(paths, holes):
+            self.add_raw_path(p, close=True)
+        self.fill_raw_path(properties)
+
+    def draw_filled_polygon(
+        self, points: Iterable[AnyVec], properties: BackendProperties
+    ) -> None:
+        if isinstance(points, list) and points and type(points[0]) is Vec2:
+            vertices = points
+        else:
+            vertices = Vec2.list(points)
+        if len(vertices) < 3:
+            return
+        self.flush_raw_strokes()
+        height = self.page_height_in_pt
+        ops = self._path_ops
+        start = vertices[0]
+        ops.append(f"{start.x:g} {height - start.y:g} m\n")
+        for v in vertices[1:]:
+            ops.append(f"{v.x:g} {height - v.y:g} l\n")
+        self.fill_raw_path(properties)
+
+    @no_type_check
+    def add_raw_path(self, path: Path2d, close: bool) -> None:
+        # same traversal as add_path_to_shape(), but emitting PDF operators
+        vertices = path.control_vertices()
+        if not vertices:
+            return
+        height = self.page_height_in_pt
+        ops = self._path_ops
+        line_to = Command.LINE_TO
+        curve3_to = Command.CURVE3_TO
+        curve4_to = Command.CURVE4_TO
+
+        start = vertices[0]
+        sub_path_start = start
+        current = self._current_point
+        if current is None or not current.isclose(start):
+            ops.append(f"{start.x:g} {height - start.y:g} m\n")
+        index = 1
+        for command in path.command_codes():
+            if command == line_to:
+                end = vertices[index]
+                index += 1
+                ops.append(f"{end.x:g} {height - end.y:g} l\n")
+            elif command == curve3_to:
+                ctrl = vertices[index]
+                end = vertices[index + 1]
+                index += 2
+                # quadratic to cubic Bézier with the same kappa factor as
+                # Shape.drawCurve(), to render identical to the base class:
+                kappa = 0.55228474983
+                c1 = start + (ctrl - start) * kappa
+                c2 = end + (ctrl - end) * kappa
+                ops.append(
+                    f"{c1.x:g} {height - c1.y:g} {c2.x:g} {height - c2.y:g} "
+                    f"{end.x:g} {height - end.y:g} c\n"
+                )
+            elif command == curve4_to:
+                c1 = vertices[index]
+                c2 = vertices[index + 1]
+                end = vertices[index + 2]
+                index += 3
+                ops.append(
+                    f"{c1.x:g} {height - c1.y:g} {c2.x:g} {height - c2.y:g} "
+                    f"{end.x:g} {height - end.y:g} c\n"
+                )
+            else:  # Command.MOVE_TO
+                end = vertices[index]
+                index += 1
+                if close and not sub_path_start.isclose(end):
+                    ops.append(f"{sub_path_start.x:g} {height - sub_path_start.y:g} l\n")
+                sub_path_start = end
+                ops.append(f"{end.x:g} {height - end.y:g} m\n")
+            start = end
+        if close and not sub_path_start.isclose(start):
+            ops.append(f"{sub_path_start.x:g} {height - sub_path_start.y:g} l\n")
+        self._current_point = start
+
+    def finalize(self) -> None:
+        self.flush_raw_strokes()
+        if self._content:
+            # same pattern as Shape.commit(): insert a dummy /Contents object
+            # and update it, update_stream() compresses the stream
+            xref = fitz.TOOLS._insert_contents(self.page, b" ", True)
+            self.doc.update_stream(xref, "".join(self._content).encode())
+            self._content.clear()
+
+
 @no_type_check
 def add_path_to_shape(shape, path: Path2d, close: bool) -> None:
-    start = path.start
+    # Iterates the command codes and control vertices directly, path.commands()
+    # would build a PathElement tuple for every command - this is the hot loop
+    # for path-heavy drawings.
+    vertices = path.control_vertices()
+    if not vertices:
+        return
+    # bind attribute lookups to locals, this loop runs once per command:
+    draw_line = shape.drawLine
+    draw_polyline = shape.drawPolyline
+    draw_curve = shape.drawCurve
+    draw_bezier = shape.drawBezier
+    line_to = Command.LINE_TO
+    curve3_to = Command.CURVE3_TO
+    curve4_to = Command.CURVE4_TO
+
+    start = vertices[0]
     sub_path_start = start
     last_point = start
-    for command in path.commands():
-        end = command.end
-        if command.type == Command.MOVE_TO:
+    index = 1
+    # collects consecutive LINE_TO runs, including the run start point:
+    line_run: list = []
+    for command in path.command_codes():
+        if command == line_to:
+            end = vertices[index]
+            index += 1
+            if not line_run:
+                line_run.append(start)
+            line_run.append(end)
+            start = end
+            last_point = end
+            continue
+        if line_run:
+            # a single drawPolyline call instead of one drawLine per segment
+            draw_polyline(line_run)
+            line_run = []
+        if command == curve3_to:
+            end = vertices[index + 1]
+            draw_curve(start, vertices[index], end)
+            index += 2
+        elif command == curve4_to:
+            end = vertices[index + 2]
+            draw_bezier(start, vertices[index], vertices[index + 1], end)
+            index += 3
+        else:  # Command.MOVE_TO
+            end = vertices[index]
+            index += 1
             if close and not sub_path_start.isclose(end):
-                shape.drawLine(start, sub_path_start)
+                draw_line(start, sub_path_start)
             sub_path_start = end
-        elif command.type == Command.LINE_TO:
-            shape.drawLine(start, end)
-        elif command.type == Command.CURVE3_TO:
-            shape.drawCurve(start, command.ctrl, end)
-        elif command.type == Command.CURVE4_TO:
-            shape.drawBezier(start, command.ctrl1, command.ctrl2, end)
         start = end
         last_point = end
+    if line_run:
+        draw_polyline(line_run)
     if close and not sub_path_start.isclose(last_point):
-        shape.drawLine(last_point, sub_path_start)
+        draw_line(last_point, sub_path_start)
 
 
 def map_lineweight_to_stroke_width(
@@ -373,12 +747,13 @@ def map_lineweight_to_stroke_width(
     return min_stroke_width + round(lineweight * factor, 1)
 
 
+@functools.lru_cache(maxsize=256)
 def alpha_to_opacity(alpha: str) -> float:
     # stroke-opacity: 0.0 = transparent; 1.0 = opaque
     # alpha: "00" = transparent; "ff" = opaque
     if len(alpha):
         try:
-            return int(alpha, 16) / 255
+            return _BYTE_TO_FLOAT[bytes.fromhex(alpha)[0]]
         except ValueError:
             pass
     return 1.0
@@ -18,6 +18,7 @@ class UnifiedTextRenderer(TextRenderer):
 
     def __init__(self) -> None:
         self._font_cache: dict[str, fonts.AbstractFont] = dict()
+        self._text_path_cache: dict[tuple[str, str, float], ezdxf.path.Path2d] = dict()
 
     def get_font(self, font_face: fonts.FontFace) -> fonts.AbstractFont:
         if not font_face.filename and font_face.family:
@@ -50,8 +51,18 @@ class UnifiedTextRenderer(TextRenderer):
     def get_text_path(
         self, text: str, font_face: fonts.FontFace, cap_height: float = 1.0
     ) -> ezdxf.path.Path2d:
+        # Text paths are cached untransformed, the same labels are repeated
+        # many times in large drawings.  Path2d.transform() returns a new path,
+        # so cached paths are not mutated by the callers.
         abstract_font = self.get_font(font_face)
-        return abstract_font.text_path_ex(text, cap_height)
+        key = (text, abstract_font.name, cap_height)
+        try:
+            return self._text_path_cache[key]
+        except KeyError:
+            pass
+        text_path = abstract_font.text_path_ex(text, cap_height)
+        self._text_path_cache[key] = text_path
+        return text_path
 
     def get_text_line_width(
         self,
@@ -33,21 +33,22 @@ Import path tools from ezdxf.path:
 
 """
 from __future__ import annotations
-from typing import (
-    Any,
-    Callable,
-    Dict,
-    Hashable,
-    Iterable,
-    List,
-    Sequence,
-    TYPE_CHECKING,
-    Tuple,
-    Union,
-)
-from typing_extensions import TypeAlias
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        Hashable,
+        Iterable,
+        List,
+        Sequence,
+        Tuple,
+        Union,
+    )
+    from typing_extensions import TypeAlias
+
     from ezdxf.entities import DXFEntity
     from ezdxf.layouts.base import VirtualLayout
     from ezdxf.layouts.blocklayout import BlockLayout
@@ -318,6 +318,12 @@ def test_random_shuffle_interface(packer):
     assert best.get_fill_ratio() > 0.0
 
 
+def test_random_shuffle_parallel_interface(packer):
+    packer.add_bin(*LARGE_BOX2)
+    best = bp.shuffle_pack(packer, 2, max_workers=2)
+    assert best.get_fill_ratio() > 0.0
+
+
 def test_random_shuffle_raise_exception_for_invalid_attempts(packer):
     with pytest.raises(ValueError):
         bp.shuffle_pack(packer, 0)